@@ -0,0 +1,100 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-15 02:10:42.792036
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('organization',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('invite_code', sa.String(), nullable=True),
+    sa.Column('cpu_allocated', sa.Float(), server_default='0', nullable=False),
+    sa.Column('ram_allocated', sa.Float(), server_default='0', nullable=False),
+    sa.Column('gpu_allocated', sa.Float(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_organization_id'), 'organization', ['id'], unique=False)
+    op.create_index(op.f('ix_organization_invite_code'), 'organization', ['invite_code'], unique=True)
+    op.create_index(op.f('ix_organization_name'), 'organization', ['name'], unique=False)
+    op.create_table('cluster',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('organization_id', sa.Integer(), nullable=True),
+    sa.Column('cpu_limit', sa.Float(), nullable=True),
+    sa.Column('ram_limit', sa.Float(), nullable=True),
+    sa.Column('gpu_limit', sa.Float(), nullable=True),
+    sa.Column('cpu_available', sa.Float(), nullable=True),
+    sa.Column('ram_available', sa.Float(), nullable=True),
+    sa.Column('gpu_available', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['organization_id'], ['organization.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cluster_id'), 'cluster', ['id'], unique=False)
+    op.create_index(op.f('ix_cluster_name'), 'cluster', ['name'], unique=False)
+    op.create_index('ix_cluster_org_id', 'cluster', ['organization_id', 'id'], unique=False)
+    op.create_table('user',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=True),
+    sa.Column('username', sa.String(), nullable=True),
+    sa.Column('hashed_password', sa.String(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('organization_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['organization_id'], ['organization.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_user_email'), 'user', ['email'], unique=True)
+    op.create_index(op.f('ix_user_id'), 'user', ['id'], unique=False)
+    op.create_index(op.f('ix_user_username'), 'user', ['username'], unique=True)
+    op.create_table('deployment',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('cluster_id', sa.Integer(), nullable=True),
+    sa.Column('docker_image', sa.String(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'FAILED', 'COMPLETED', 'PREEMPTED', name='deploymentstatus'), nullable=True),
+    sa.Column('priority', sa.Integer(), nullable=True),
+    sa.Column('cpu_required', sa.Float(), nullable=True),
+    sa.Column('ram_required', sa.Float(), nullable=True),
+    sa.Column('gpu_required', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['cluster_id'], ['cluster.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_deployment_cluster_status_priority', 'deployment', ['cluster_id', 'status', 'priority'], unique=False)
+    op.create_index(op.f('ix_deployment_id'), 'deployment', ['id'], unique=False)
+    op.create_index(op.f('ix_deployment_name'), 'deployment', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_deployment_name'), table_name='deployment')
+    op.drop_index(op.f('ix_deployment_id'), table_name='deployment')
+    op.drop_index('ix_deployment_cluster_status_priority', table_name='deployment')
+    op.drop_table('deployment')
+    sa.Enum(name='deploymentstatus').drop(op.get_bind(), checkfirst=True)
+    op.drop_index(op.f('ix_user_username'), table_name='user')
+    op.drop_index(op.f('ix_user_id'), table_name='user')
+    op.drop_index(op.f('ix_user_email'), table_name='user')
+    op.drop_table('user')
+    op.drop_index('ix_cluster_org_id', table_name='cluster')
+    op.drop_index(op.f('ix_cluster_name'), table_name='cluster')
+    op.drop_index(op.f('ix_cluster_id'), table_name='cluster')
+    op.drop_table('cluster')
+    op.drop_index(op.f('ix_organization_name'), table_name='organization')
+    op.drop_index(op.f('ix_organization_invite_code'), table_name='organization')
+    op.drop_index(op.f('ix_organization_id'), table_name='organization')
+    op.drop_table('organization')
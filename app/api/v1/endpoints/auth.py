@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core import deps, security
 from app.schemas.user import UserCreate, User
 from app.models.user import User as UserModel
@@ -12,40 +13,71 @@ async def login(
     response: Response,
     username: str,
     password: str,
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_db)
 ):
     """
-    TODO: Implement login endpoint using session
-    Example:
-    - Find user by username
-    - Verify password
-    - Set user_id in session
-    - Return success message
+    Authenticate a user and store their id in the session.
     """
-    pass
+    user = await db.scalar(select(UserModel).where(UserModel.username == username))
+    if not await security.verify_password_or_dummy(password, user.hashed_password if user else None):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password"
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    if security.password_needs_rehash(user.hashed_password):
+        user.hashed_password = await security.get_password_hash(password)
+        await db.commit()
+    request.session["user_id"] = user.id
+    return {"message": "Successfully logged in"}
 
 @router.post("/register", response_model=User)
 async def register(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     user_in: UserCreate
 ):
     """
-    TODO: Implement user registration
-    Example:
-    - Check if username/email already exists
-    - Hash password
-    - Create user in database
-    - Return user data
+    Register a new user with an argon2id-hashed password.
     """
-    pass
+    # Check username and email in a single round-trip
+    conditions = [UserModel.username == user_in.username]
+    if user_in.email:
+        conditions.append(UserModel.email == user_in.email)
+    existing = (await db.execute(
+        select(UserModel.username, UserModel.email).where(or_(*conditions)).limit(1)
+    )).first()
+    if existing and existing.username == user_in.username:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already registered"
+        )
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    user = UserModel(
+        email=user_in.email,
+        username=user_in.username,
+        hashed_password=await security.get_password_hash(user_in.password)
+    )
+    db.add(user)
+    await db.commit()
+    await db.refresh(user)
+    return user
 
 @router.post("/logout")
 async def logout(request: Request):
     """
-    TODO: Implement logout endpoint
-    Example:
+    Clear the session and drop the cached user snapshot.
+    """
+    user_id = request.session.get("user_id")
+    if user_id:
+        await deps.invalidate_user_cache(user_id)
     request.session.clear()
     return {"message": "Successfully logged out"}
-    """
-    pass
@@ -1,30 +1,82 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.core import deps
+from app.core.cache import CLUSTERS_NAMESPACE, invalidate_organization_cache, organization_cache
+from app.core.config import settings
+from app.models.cluster import Cluster as ClusterModel
+from app.models.organization import Organization as OrganizationModel
 from app.schemas.cluster import Cluster, ClusterCreate
-from app.models.user import User
 
 router = APIRouter()
 
 @router.post("/", response_model=Cluster)
-def create_cluster(
+async def create_cluster(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     cluster_in: ClusterCreate,
-    current_user: User = Depends(deps.get_current_user)
+    current_user: deps.CurrentUser = Depends(deps.get_current_user)
 ):
     """
-    TODO: Implement cluster creation
+    Create a cluster in the user's organization, within the organization quota.
     """
-    pass
+    if current_user.organization_id is None or cluster_in.organization_id != current_user.organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not a member of this organization"
+        )
+
+    # Check and bump the organization's running totals in one atomic UPDATE
+    allocated = await db.scalar(
+        update(OrganizationModel)
+        .where(
+            OrganizationModel.id == current_user.organization_id,
+            OrganizationModel.cpu_allocated + cluster_in.cpu_limit <= settings.ORG_CPU_LIMIT,
+            OrganizationModel.ram_allocated + cluster_in.ram_limit <= settings.ORG_RAM_LIMIT,
+            OrganizationModel.gpu_allocated + cluster_in.gpu_limit <= settings.ORG_GPU_LIMIT
+        )
+        .values(
+            cpu_allocated=OrganizationModel.cpu_allocated + cluster_in.cpu_limit,
+            ram_allocated=OrganizationModel.ram_allocated + cluster_in.ram_limit,
+            gpu_allocated=OrganizationModel.gpu_allocated + cluster_in.gpu_limit
+        )
+        .returning(OrganizationModel.id)
+    )
+    if allocated is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Organization resource quota exceeded"
+        )
+
+    cluster = ClusterModel(
+        **cluster_in.model_dump(),
+        cpu_available=cluster_in.cpu_limit,
+        ram_available=cluster_in.ram_limit,
+        gpu_available=cluster_in.gpu_limit
+    )
+    db.add(cluster)
+    await db.commit()
+    await db.refresh(cluster)
+    await invalidate_organization_cache(cluster.organization_id)
+    return cluster
 
 @router.get("/", response_model=List[Cluster])
-def list_clusters(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user)
+@organization_cache(CLUSTERS_NAMESPACE)
+async def list_clusters(
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: deps.CurrentUser = Depends(deps.get_current_user)
 ):
     """
-    TODO: Implement cluster listing
+    List the clusters of the user's organization.
+
+    Served from a short-lived cache that is dropped whenever the
+    organization's clusters change.
     """
-    pass
+    clusters = await db.scalars(
+        select(ClusterModel)
+        .where(ClusterModel.organization_id == current_user.organization_id)
+        .order_by(ClusterModel.id)
+    )
+    # Return schemas rather than ORM rows so the result can be cached
+    return [Cluster.model_validate(cluster) for cluster in clusters]
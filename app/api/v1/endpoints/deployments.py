@@ -1,30 +1,193 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.core import deps
+from app.core.cache import invalidate_organization_cache
+from app.models.cluster import Cluster as ClusterModel
+from app.models.deployment import Deployment as DeploymentModel, DeploymentStatus
 from app.schemas.deployment import Deployment, DeploymentCreate
-from app.models.user import User
 
 router = APIRouter()
 
+async def reserve_resources(
+    db: AsyncSession,
+    cluster_id: int,
+    cpu: float,
+    ram: float,
+    gpu: float
+) -> bool:
+    """
+    Atomically take resources from a cluster if enough are available.
+
+    The capacity check and the write happen in a single UPDATE, so
+    concurrent schedulers cannot oversubscribe a cluster. Negative amounts
+    hand resources back.
+    """
+    reserved = await db.scalar(
+        update(ClusterModel)
+        .where(
+            ClusterModel.id == cluster_id,
+            ClusterModel.cpu_available >= cpu,
+            ClusterModel.ram_available >= ram,
+            ClusterModel.gpu_available >= gpu
+        )
+        .values(
+            cpu_available=ClusterModel.cpu_available - cpu,
+            ram_available=ClusterModel.ram_available - ram,
+            gpu_available=ClusterModel.gpu_available - gpu
+        )
+        .returning(ClusterModel.id)
+    )
+    return reserved is not None
+
+async def preempt_lower_priority_deployments(
+    db: AsyncSession,
+    cluster: ClusterModel,
+    deployment: DeploymentCreate
+) -> bool:
+    """
+    Preempt running lower-priority deployments and reserve room for a new one.
+
+    The victim set is picked in one query: a window function keeps running
+    totals of the candidates' resources and stops at the first prefix that
+    covers the shortfall. Nothing is preempted unless that frees enough.
+    """
+    # Shortfall per resource; a non-positive value means it already fits
+    cpu_needed = deployment.cpu_required - cluster.cpu_available
+    ram_needed = deployment.ram_required - cluster.ram_available
+    gpu_needed = deployment.gpu_required - cluster.gpu_available
+
+    # Lock the candidates, skipping rows another scheduler is already preempting
+    candidates = (
+        select(
+            DeploymentModel.id,
+            DeploymentModel.priority,
+            DeploymentModel.cpu_required,
+            DeploymentModel.ram_required,
+            DeploymentModel.gpu_required
+        )
+        .where(
+            DeploymentModel.cluster_id == cluster.id,
+            DeploymentModel.status == DeploymentStatus.RUNNING,
+            DeploymentModel.priority < deployment.priority
+        )
+        .with_for_update(skip_locked=True)
+        .cte("candidates")
+    )
+    # Victims are taken lowest priority first, newest first within a priority
+    victim_order = (candidates.c.priority, candidates.c.id.desc())
+    running = select(
+        candidates.c.id,
+        candidates.c.priority,
+        candidates.c.cpu_required,
+        candidates.c.ram_required,
+        candidates.c.gpu_required,
+        func.sum(candidates.c.cpu_required).over(order_by=victim_order).label("freed_cpu"),
+        func.sum(candidates.c.ram_required).over(order_by=victim_order).label("freed_ram"),
+        func.sum(candidates.c.gpu_required).over(order_by=victim_order).label("freed_gpu")
+    ).cte("running")
+    # Keep the shortest prefix whose running totals cover every shortfall
+    victims = (await db.execute(
+        select(running.c.id, running.c.freed_cpu, running.c.freed_ram, running.c.freed_gpu)
+        .where(or_(
+            running.c.freed_cpu - running.c.cpu_required < cpu_needed,
+            running.c.freed_ram - running.c.ram_required < ram_needed,
+            running.c.freed_gpu - running.c.gpu_required < gpu_needed
+        ))
+        .order_by(running.c.priority, running.c.id.desc())
+    )).all()
+    if not victims:
+        return False
+    freed = victims[-1]
+    if freed.freed_cpu < cpu_needed or freed.freed_ram < ram_needed or freed.freed_gpu < gpu_needed:
+        return False
+
+    # Release the victims' share and claim the new deployment's in one step
+    if not await reserve_resources(
+        db,
+        cluster.id,
+        deployment.cpu_required - freed.freed_cpu,
+        deployment.ram_required - freed.freed_ram,
+        deployment.gpu_required - freed.freed_gpu
+    ):
+        return False
+
+    # One UPDATE for all victims instead of one per dirty ORM object
+    await db.execute(
+        update(DeploymentModel)
+        .where(DeploymentModel.id.in_([victim.id for victim in victims]))
+        .values(status=DeploymentStatus.PREEMPTED)
+    )
+    return True
+
+async def schedule_deployment(
+    db: AsyncSession,
+    cluster: ClusterModel,
+    deployment: DeploymentCreate
+) -> DeploymentStatus:
+    """
+    Reserve room for a deployment, preempting lower priorities if needed.
+
+    Returns the status the deployment should start in; deployments that
+    cannot be placed stay pending.
+    """
+    if await reserve_resources(
+        db, cluster.id, deployment.cpu_required, deployment.ram_required, deployment.gpu_required
+    ) or await preempt_lower_priority_deployments(db, cluster, deployment):
+        return DeploymentStatus.RUNNING
+    return DeploymentStatus.PENDING
+
 @router.post("/", response_model=Deployment)
-def create_deployment(
+async def create_deployment(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     deployment_in: DeploymentCreate,
-    current_user: User = Depends(deps.get_current_user)
+    current_user: deps.CurrentUser = Depends(deps.get_current_user)
 ):
     """
-    TODO: Implement deployment creation and scheduling
+    Create a deployment and schedule it on its cluster.
     """
-    pass
+    cluster = await db.get(ClusterModel, deployment_in.cluster_id)
+    if not cluster or cluster.organization_id != current_user.organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cluster not found"
+        )
+    if (
+        deployment_in.cpu_required > cluster.cpu_limit
+        or deployment_in.ram_required > cluster.ram_limit
+        or deployment_in.gpu_required > cluster.gpu_limit
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Deployment requires more resources than the cluster provides"
+        )
+
+    deployment_status = await schedule_deployment(db, cluster, deployment_in)
+    # Single INSERT ... RETURNING; no unit-of-work flush or refresh SELECT
+    deployment = await db.scalar(
+        insert(DeploymentModel)
+        .values(**deployment_in.model_dump(), status=deployment_status)
+        .returning(DeploymentModel)
+    )
+    await db.commit()
+    if deployment_status == DeploymentStatus.RUNNING:
+        await invalidate_organization_cache(cluster.organization_id)
+    return deployment
 
 @router.get("/", response_model=List[Deployment])
-def list_deployments(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user)
+async def list_deployments(
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: deps.CurrentUser = Depends(deps.get_current_user)
 ):
     """
-    TODO: Implement deployment listing
+    List the deployments on the clusters of the user's organization.
     """
-    pass
+    deployments = await db.scalars(
+        select(DeploymentModel)
+        .join(ClusterModel, DeploymentModel.cluster_id == ClusterModel.id)
+        .where(ClusterModel.organization_id == current_user.organization_id)
+        .order_by(DeploymentModel.id)
+    )
+    return deployments.all()
@@ -1,32 +1,123 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import secrets
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.core import deps
-from app.schemas.organization import Organization, OrganizationCreate
-from app.models.user import User
+from app.core.cache import ORGANIZATION_RESOURCES_NAMESPACE, organization_cache
+from app.models.cluster import Cluster as ClusterModel
+from app.models.organization import Organization as OrganizationModel
+from app.models.user import User as UserModel
+from app.schemas.organization import Organization, OrganizationCreate, OrganizationResources, ResourceAmounts
 
 router = APIRouter()
 
+# The unique index on invite_code is the collision check; with ~72 bits of
+# entropy a second attempt is only needed in the astronomically rare case
+INVITE_CODE_ATTEMPTS = 2
+
+def generate_invite_code() -> str:
+    """
+    Return a random 12-character URL-safe invite code.
+    """
+    return secrets.token_urlsafe(9)
+
 @router.post("/", response_model=Organization)
-def create_organization(
+async def create_organization(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     organization_in: OrganizationCreate,
-    current_user: User = Depends(deps.get_current_user)
+    current_user: deps.CurrentUser = Depends(deps.get_current_user)
 ):
     """
-    TODO: Implement organization creation
+    Create an organization with a random invite code and join it.
     """
-    pass
+    if current_user.organization_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User already belongs to an organization"
+        )
+
+    for _ in range(INVITE_CODE_ATTEMPTS):
+        organization = OrganizationModel(name=organization_in.name, invite_code=generate_invite_code())
+        try:
+            async with db.begin_nested():
+                db.add(organization)
+            break
+        except IntegrityError:
+            continue
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Could not generate a unique invite code"
+        )
+
+    user = await db.get(UserModel, current_user.id)
+    user.organization_id = organization.id
+    await db.commit()
+    await deps.invalidate_user_cache(current_user.id)
+    return organization
 
-@router.post("/{invite_code}/join")
-def join_organization(
+@router.post("/{invite_code}/join", response_model=Organization)
+async def join_organization(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_db),
     invite_code: str,
-    current_user: User = Depends(deps.get_current_user)
+    current_user: deps.CurrentUser = Depends(deps.get_current_user)
 ):
     """
-    TODO: Implement organization joining logic
+    Join an organization using its invite code.
+    """
+    if current_user.organization_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User already belongs to an organization"
+        )
+    organization = await db.scalar(
+        select(OrganizationModel).where(OrganizationModel.invite_code == invite_code)
+    )
+    if not organization:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Invalid invite code"
+        )
+
+    user = await db.get(UserModel, current_user.id)
+    user.organization_id = organization.id
+    await db.commit()
+    await deps.invalidate_user_cache(current_user.id)
+    return organization
+
+@router.get("/{organization_id}/resources", response_model=OrganizationResources)
+@organization_cache(ORGANIZATION_RESOURCES_NAMESPACE)
+async def get_organization_resources(
+    organization_id: int,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: deps.CurrentUser = Depends(deps.get_organization_member)
+):
+    """
+    Summarize resource limits and usage across the organization's clusters.
+
+    Served from a short-lived cache; a few seconds of staleness is fine for
+    dashboards.
     """
-    pass
+    cpu_total, ram_total, gpu_total, cpu_available, ram_available, gpu_available = (await db.execute(
+        select(
+            func.coalesce(func.sum(ClusterModel.cpu_limit), 0),
+            func.coalesce(func.sum(ClusterModel.ram_limit), 0),
+            func.coalesce(func.sum(ClusterModel.gpu_limit), 0),
+            func.coalesce(func.sum(ClusterModel.cpu_available), 0),
+            func.coalesce(func.sum(ClusterModel.ram_available), 0),
+            func.coalesce(func.sum(ClusterModel.gpu_available), 0)
+        ).where(ClusterModel.organization_id == organization_id)
+    )).one()
+    return OrganizationResources(
+        total_resources=ResourceAmounts(cpu=cpu_total, ram=ram_total, gpu=gpu_total),
+        used_resources=ResourceAmounts(
+            cpu=cpu_total - cpu_available,
+            ram=ram_total - ram_available,
+            gpu=gpu_total - gpu_available
+        ),
+        available_resources=ResourceAmounts(cpu=cpu_available, ram=ram_available, gpu=gpu_available)
+    )
@@ -0,0 +1,61 @@
+import functools
+import inspect
+from typing import Any, Callable, Optional
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from starlette.requests import Request
+from starlette.responses import Response
+from app.db.redis import redis_client
+
+# Cache namespaces for organization-scoped, stale-tolerant reads
+CLUSTERS_NAMESPACE = "clusters"
+ORGANIZATION_RESOURCES_NAMESPACE = "orgres"
+
+def organization_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None
+) -> str:
+    """
+    Key cached responses on the caller's organization.
+    """
+    return f"{namespace}:{kwargs['current_user'].organization_id}"
+
+def organization_cache(namespace: str, expire: int = 5) -> Callable:
+    """
+    Cache an endpoint's result in Redis, keyed on the caller's organization.
+
+    fastapi-cache advertises the entry to HTTP caches with ``max-age``, but
+    these responses depend on the session cookie and one URL serves every
+    organization, so the header is replaced to keep them out of shared
+    proxies and CDNs.
+    """
+    def decorator(func: Callable) -> Callable:
+        cached = cache(expire=expire, namespace=namespace, key_builder=organization_key_builder)(func)
+        # fastapi-cache injects a Response parameter to set its headers on
+        response_param = next(
+            param for param in inspect.signature(cached).parameters.values()
+            if param.annotation is Response
+        )
+
+        @functools.wraps(cached)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await cached(*args, **kwargs)
+            kwargs[response_param.name].headers["Cache-Control"] = "private, no-store"
+            return result
+        return wrapper
+    return decorator
+
+async def invalidate_organization_cache(organization_id: int) -> None:
+    """
+    Drop cached cluster listings and resource totals for an organization.
+    """
+    prefix = FastAPICache.get_prefix()
+    await redis_client.delete(
+        f"{prefix}:{CLUSTERS_NAMESPACE}:{organization_id}",
+        f"{prefix}:{ORGANIZATION_RESOURCES_NAMESPACE}:{organization_id}"
+    )
@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from typing import List
 import os
 
 class Settings(BaseSettings):
@@ -11,12 +12,38 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = os.getenv("PGPASSWORD", "")
     POSTGRES_DB: str = os.getenv("PGDATABASE", "cluster_management")
     POSTGRES_PORT: str = os.getenv("PGPORT", "5432")
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    
+    # Redis configuration
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    USER_CACHE_TTL: int = 300  # 5 minutes in seconds
+    
+    # Organization-wide quota across all clusters
+    ORG_CPU_LIMIT: int = 100
+    ORG_RAM_LIMIT: int = 1024
+    ORG_GPU_LIMIT: int = 8
+    
+    # Rate limiting (requests per client per minute)
+    LOGIN_RATE_LIMIT_PER_MINUTE: int = 10
+    DEPLOYMENTS_RATE_LIMIT_PER_MINUTE: int = 60
+    
+    # Browser origins allowed to call the API with the session cookie
+    # (a JSON list in the environment)
+    CORS_ORIGINS: List[str] = ["http://localhost:3000"]
     
     # Session configuration
     SECRET_KEY: str = "TODO_CHANGE_THIS_SECRET_KEY"  # TODO: Change in production
     SESSION_COOKIE_NAME: str = "session"
     SESSION_MAX_AGE: int = 1800  # 30 minutes in seconds
     
+    # Password hashing configuration
+    PASSWORD_HASH_WORKERS: int = os.cpu_count() or 1
+    # argon2id cost; calibrate with: python -m scripts.calibrate_password_hash
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 64 * 1024  # in KiB
+    ARGON2_PARALLELISM: int = 1
+    
     # Database URL
     DATABASE_URL: str = os.getenv(
         "DATABASE_URL",
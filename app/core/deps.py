@@ -1,35 +1,85 @@
-from typing import Generator, Optional
+from dataclasses import asdict, dataclass
+from typing import AsyncGenerator, Optional
+import msgpack
 from fastapi import Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db.redis import redis_client
 from app.db.session import SessionLocal
 from app.models.user import User
 
-def get_db() -> Generator:
-    db = SessionLocal()
-    try:
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """
+    Lightweight snapshot of the authenticated user, cached in Redis.
+
+    Load the ORM ``User`` explicitly when the row itself must be modified.
+    """
+    id: int
+    username: str
+    email: Optional[str]
+    is_active: bool
+    organization_id: Optional[int]
+
+def _user_cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+async def invalidate_user_cache(user_id: int) -> None:
+    """
+    Drop the cached snapshot so the next request reloads it from the DB.
+    """
+    await redis_client.delete(_user_cache_key(user_id))
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 async def get_current_user(
     request: Request,
-    db: Session = Depends(get_db)
-) -> Optional[User]:
+    db: AsyncSession = Depends(get_db)
+) -> CurrentUser:
+    """
+    Resolve the logged-in user from the session cookie.
+
+    Served from Redis when possible; the DB is only hit on a cache miss.
     """
-    TODO: Implement current user validation from session
-    Example:
     user_id = request.session.get("user_id")
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated"
         )
-    user = db.query(User).filter(User.id == user_id).first()
+    key = _user_cache_key(user_id)
+    cached = await redis_client.get(key)
+    if cached is not None:
+        return CurrentUser(**msgpack.unpackb(cached))
+
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
-    return user
+    current_user = CurrentUser(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        is_active=user.is_active,
+        organization_id=user.organization_id
+    )
+    await redis_client.set(key, msgpack.packb(asdict(current_user)), ex=settings.USER_CACHE_TTL)
+    return current_user
+
+async def get_organization_member(
+    organization_id: int,
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """
-    pass
+    Ensure the current user belongs to the organization in the path.
+    """
+    if current_user.organization_id != organization_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not a member of this organization"
+        )
+    return current_user
@@ -1,19 +1,86 @@
-from passlib.context import CryptContext
+import asyncio
+import hmac
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id; bcrypt hashes are still accepted and get
+# upgraded on the next successful login
+password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+# Verified against when the user does not exist, so login takes as long for
+# unknown usernames as for known ones
+_DUMMY_HASH = password_hasher.hash("dummy-password")
+
+# argon2 and bcrypt release the GIL while hashing, so a thread pool spreads the work
+# across cores without the pickling and fork hazards of a process pool
+_password_executor: Optional[Executor] = None
+
+def start_password_executor() -> None:
+    """
+    Create the pool that runs password hashing off the event loop (app startup).
+    """
+    global _password_executor
+    _password_executor = ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        thread_name_prefix="password"
+    )
+
+def shutdown_password_executor() -> None:
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False)
+        _password_executor = None
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith("$argon2"):
+        try:
+            return password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    # Legacy bcrypt hash: re-hash with the stored salt and compare in constant time
+    stored_hash = hashed_password.encode()
+    computed_hash = bcrypt.hashpw(plain_password.encode(), stored_hash)
+    return hmac.compare_digest(computed_hash, stored_hash)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plain password against its argon2id or legacy bcrypt hash.
+
+    Runs in the password executor so the event loop stays responsive.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _password_executor, _verify_password, plain_password, hashed_password
+    )
+
+async def verify_password_or_dummy(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a password, spending the same hashing work when there is no user.
+
+    Pass None as the hash for a missing user; the result is then always False.
+    """
+    verified = await verify_password(plain_password, hashed_password or _DUMMY_HASH)
+    return verified and hashed_password is not None
+
+async def get_password_hash(password: str) -> str:
     """
-    TODO: Implement password verification using bcrypt
-    Example:
-    return pwd_context.verify(plain_password, hashed_password)
+    Hash a password using argon2id.
+
+    Runs in the password executor so the event loop stays responsive.
     """
-    pass
+    return await asyncio.get_running_loop().run_in_executor(
+        _password_executor, password_hasher.hash, password
+    )
 
-def get_password_hash(password: str) -> str:
+def password_needs_rehash(hashed_password: str) -> bool:
     """
-    TODO: Implement password hashing using bcrypt
-    Example:
-    return pwd_context.hash(password)
+    Whether a stored hash is bcrypt or uses outdated argon2 parameters.
     """
-    pass
+    return not hashed_password.startswith("$argon2") or password_hasher.check_needs_rehash(hashed_password)
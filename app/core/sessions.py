@@ -0,0 +1,115 @@
+import hashlib
+import hmac
+import json
+import secrets
+import typing
+from redis.asyncio import Redis
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+class RedisSessionMiddleware:
+    """
+    Server-side sessions stored in Redis.
+
+    Drop-in replacement for Starlette's ``SessionMiddleware``: handlers keep
+    using ``request.session``, but the cookie only carries an opaque session
+    id and the data lives under ``sess:<id>``. Clearing the session deletes
+    the key, so logout revokes the session server-side.
+
+    The id is tagged with a keyed BLAKE2b MAC so forged or garbage cookies
+    are rejected before touching Redis. Whenever the session's user changes
+    the id is replaced, so a session id planted before login never becomes
+    authenticated (session fixation).
+    """
+
+    # Session entry identifying the logged-in user
+    user_key = "user_id"
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis: Redis,
+        secret_key: str,
+        session_cookie: str = "session",
+        max_age: int = 14 * 24 * 60 * 60,  # 14 days, in seconds
+        path: str = "/",
+        same_site: typing.Literal["lax", "strict", "none"] = "lax",
+        https_only: bool = False,
+    ) -> None:
+        self.app = app
+        self.redis = redis
+        # BLAKE2b keys are capped at 64 bytes; hash the secret down so any
+        # SECRET_KEY length works
+        self.signing_key = hashlib.blake2b(secret_key.encode(), digest_size=32).digest()
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.path = path
+        self.security_flags = "httponly; samesite=" + same_site
+        if https_only:  # Secure flag can be used with HTTPS only
+            self.security_flags += "; secure"
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"sess:{session_id}"
+
+    def _sign(self, session_id: str) -> str:
+        return hashlib.blake2b(session_id.encode(), key=self.signing_key, digest_size=16).hexdigest()
+
+    def _unsign(self, cookie: str) -> typing.Optional[str]:
+        session_id, _, signature = cookie.rpartition(".")
+        # Cookies are decoded as latin-1; compare bytes so non-ASCII junk
+        # is simply a mismatch rather than a TypeError
+        if session_id and hmac.compare_digest(signature.encode("latin-1"), self._sign(session_id).encode()):
+            return session_id
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        cookie = connection.cookies.get(self.session_cookie)
+        session_id = self._unsign(cookie) if cookie else None
+        initial_session = {}
+
+        if session_id:
+            # Read and slide the expiry in a single round-trip
+            data = await self.redis.getex(self._key(session_id), ex=self.max_age)
+            if data is not None:
+                initial_session = json.loads(data)
+            else:
+                session_id = None
+        scope["session"] = dict(initial_session)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal session_id
+            if message["type"] == "http.response.start":
+                session = scope["session"]
+                if session:
+                    if session_id is not None and session.get(self.user_key) != initial_session.get(self.user_key):
+                        await self.redis.delete(self._key(session_id))
+                        session_id = None
+                    if session_id is None:
+                        session_id = secrets.token_urlsafe(32)
+                    if session != initial_session:
+                        await self.redis.set(self._key(session_id), json.dumps(session), ex=self.max_age)
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Set-Cookie",
+                        f"{self.session_cookie}={session_id}.{self._sign(session_id)}; path={self.path}; "
+                        f"Max-Age={self.max_age}; {self.security_flags}"
+                    )
+                elif session_id is not None:
+                    # The session has been cleared
+                    await self.redis.delete(self._key(session_id))
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Set-Cookie",
+                        f"{self.session_cookie}=null; path={self.path}; "
+                        f"expires=Thu, 01 Jan 1970 00:00:00 GMT; {self.security_flags}"
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,4 @@
+from redis.asyncio import Redis
+from app.core.config import settings
+
+redis_client = Redis.from_url(settings.REDIS_URL)
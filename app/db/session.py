@@ -1,6 +1,20 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Use the asyncio driver when a plain postgresql:// URL is configured
+database_url = make_url(settings.DATABASE_URL)
+if database_url.drivername == "postgresql":
+    database_url = database_url.set(drivername="postgresql+asyncpg")
+
+engine_options = {"pool_pre_ping": True}
+if database_url.get_backend_name() == "postgresql":
+    engine_options.update(pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW)
+
+# asyncpg rejects libpq's ?sslmode=, but takes the same mode names as `ssl`
+if database_url.drivername == "postgresql+asyncpg" and "sslmode" in database_url.query:
+    engine_options["connect_args"] = {"ssl": database_url.query["sslmode"]}
+    database_url = database_url.difference_update_query(["sslmode"])
+
+engine = create_async_engine(database_url, **engine_options)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
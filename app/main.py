@@ -1,14 +1,29 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.sessions import SessionMiddleware
-from sqlalchemy import create_engine
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
 from app.api.v1.api import api_router
+from app.core import security
 from app.core.config import settings
-from app.db.base import Base
+from app.core.rate_limit import RateLimiter
+from app.core.sessions import RedisSessionMiddleware
+from app.db.redis import redis_client
 from app.db.session import engine
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The schema is managed by Alembic (`alembic upgrade head`), so workers
+    # boot without touching the database catalog
+    FastAPICache.init(RedisBackend(redis_client), prefix="cache")
+
+    # Dedicated pool for password hashing so it never blocks the event loop
+    security.start_password_executor()
+    yield
+    security.shutdown_password_executor()
+    await engine.dispose()
+    await redis_client.aclose()
 
 app = FastAPI(
     title="Cluster Management API",
@@ -68,25 +83,39 @@ app = FastAPI(
         }
     ],
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Configure CORS and Session
+# Middleware added last runs first: CORS, then the rate limiter, then sessions
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.add_middleware(
-    SessionMiddleware,
+    RedisSessionMiddleware,
+    redis=redis_client,
     secret_key=settings.SECRET_KEY,
     session_cookie=settings.SESSION_COOKIE_NAME,
     max_age=settings.SESSION_MAX_AGE
 )
 
+# Inside CORS, so preflights are answered before being counted and 429s
+# still carry CORS headers; rejected requests skip session and route handling
+app.add_middleware(
+    RateLimiter,
+    redis=redis_client,
+    limits={
+        f"{settings.API_V1_STR}/auth/login": settings.LOGIN_RATE_LIMIT_PER_MINUTE,
+        f"{settings.API_V1_STR}/deployments": settings.DEPLOYMENTS_RATE_LIMIT_PER_MINUTE
+    }
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.CORS_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["content-type"],
+)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 class Cluster(Base):
+    __table_args__ = (
+        # Covers organization-scoped listings and id lookups
+        Index("ix_cluster_org_id", "organization_id", "id"),
+    )
+    
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     organization_id = Column(Integer, ForeignKey("organization.id"))
@@ -19,4 +24,5 @@ class Cluster(Base):
     
     # Relationships
     organization = relationship("Organization", back_populates="clusters")
-    deployments = relationship("Deployment", back_populates="cluster")
+    # Never lazy-load: use selectinload() when the deployments are needed
+    deployments = relationship("Deployment", back_populates="cluster", lazy="raise_on_sql")
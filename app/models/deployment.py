@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 from app.db.base_class import Base
@@ -8,8 +8,14 @@ class DeploymentStatus(enum.Enum):
     RUNNING = "running"
     FAILED = "failed"
     COMPLETED = "completed"
+    PREEMPTED = "preempted"
 
 class Deployment(Base):
+    __table_args__ = (
+        # Covers per-cluster scheduling scans filtered by status, ordered by priority
+        Index("ix_deployment_cluster_status_priority", "cluster_id", "status", "priority"),
+    )
+    
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     cluster_id = Column(Integer, ForeignKey("cluster.id"))
@@ -23,4 +29,5 @@ class Deployment(Base):
     gpu_required = Column(Float)
     
     # Relationships
-    cluster = relationship("Cluster", back_populates="deployments")
+    # Never lazy-load: pass the cluster in or use joinedload() explicitly
+    cluster = relationship("Cluster", back_populates="deployments", lazy="raise_on_sql")
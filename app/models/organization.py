@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Float
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
@@ -7,6 +7,11 @@ class Organization(Base):
     name = Column(String, index=True)
     invite_code = Column(String, unique=True, index=True)
     
+    # Cluster limits allocated against the organization quota
+    cpu_allocated = Column(Float, default=0, server_default="0", nullable=False)
+    ram_allocated = Column(Float, default=0, server_default="0", nullable=False)
+    gpu_allocated = Column(Float, default=0, server_default="0", nullable=False)
+    
     # Relationships
     users = relationship("User", back_populates="organization")
     clusters = relationship("Cluster", back_populates="organization")
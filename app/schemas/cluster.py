@@ -1,11 +1,13 @@
-from pydantic import BaseModel
-from typing import Optional
+from annotated_types import Ge, Gt
+from pydantic import BaseModel, ConfigDict
+from typing import Annotated, Optional
 
 class ClusterBase(BaseModel):
     name: str
-    cpu_limit: float
-    ram_limit: float
-    gpu_limit: float
+    # Annotated constraints are checked inside pydantic-core's compiled validator
+    cpu_limit: Annotated[float, Gt(0)]
+    ram_limit: Annotated[float, Gt(0)]
+    gpu_limit: Annotated[float, Ge(0)]
 
 class ClusterCreate(ClusterBase):
     organization_id: int
@@ -20,5 +22,4 @@ class Cluster(ClusterBase):
     ram_available: float
     gpu_available: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,13 +1,15 @@
-from pydantic import BaseModel
-from typing import Optional
+from annotated_types import Ge
+from pydantic import BaseModel, ConfigDict
+from typing import Annotated, Optional
 from app.models.deployment import DeploymentStatus
 
 class DeploymentBase(BaseModel):
     name: str
     docker_image: str
-    cpu_required: float
-    ram_required: float
-    gpu_required: float
+    # Negative amounts would hand resources back to the cluster when reserved
+    cpu_required: Annotated[float, Ge(0)]
+    ram_required: Annotated[float, Ge(0)]
+    gpu_required: Annotated[float, Ge(0)]
     priority: int = 0
 
 class DeploymentCreate(DeploymentBase):
@@ -21,5 +23,4 @@ class Deployment(DeploymentBase):
     cluster_id: int
     status: DeploymentStatus
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
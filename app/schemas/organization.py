@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 class OrganizationBase(BaseModel):
@@ -14,5 +14,14 @@ class Organization(OrganizationBase):
     id: int
     invite_code: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+class ResourceAmounts(BaseModel):
+    cpu: float
+    ram: float
+    gpu: float
+
+class OrganizationResources(BaseModel):
+    total_resources: ResourceAmounts
+    used_resources: ResourceAmounts
+    available_resources: ResourceAmounts
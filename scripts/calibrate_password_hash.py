@@ -0,0 +1,33 @@
+"""
+Measure argon2id hashing time per time cost on this machine.
+
+Pick the lowest ARGON2_TIME_COST whose time meets the security target
+(around 250 ms) on the production hardware, at the configured
+ARGON2_MEMORY_COST and ARGON2_PARALLELISM.
+
+Usage: python -m scripts.calibrate_password_hash [min_time_cost] [max_time_cost]
+"""
+import sys
+import time
+from argon2 import PasswordHasher
+from app.core.config import settings
+
+def main() -> None:
+    min_time_cost = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    max_time_cost = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    for time_cost in range(min_time_cost, max_time_cost + 1):
+        hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=settings.ARGON2_MEMORY_COST,
+            parallelism=settings.ARGON2_PARALLELISM
+        )
+        hasher.hash("warmup")
+        samples = 3
+        start = time.perf_counter()
+        for _ in range(samples):
+            hasher.hash("calibration-password")
+        elapsed_ms = (time.perf_counter() - start) / samples * 1000
+        print(f"time_cost={time_cost:2d}  {elapsed_ms:8.1f} ms/hash")
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,120 @@
+import fakeredis
+import logging
 import pytest
-from typing import Generator
+import pytest_asyncio
+from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Connection, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.db import redis as app_redis
 from app.db.base import Base
+
+# Swap in an in-process Redis before the app modules bind the client
+redis_server = fakeredis.FakeServer()
+app_redis.redis_client = fakeredis.FakeAsyncRedis(server=redis_server)
+
 from app.main import app
 from app.core.deps import get_db
 
-# Use in-memory SQLite for tests
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep the test database in memory. StaticPool hands every checkout the
+# same connection, so the schema lives for the whole session; each
+# pytest-xdist worker is its own process with its own database.
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+
+# Keep per-request framework logging out of pytest's capture machinery
+for logger_name in ("sqlalchemy.engine", "uvicorn", "httpx", "multipart"):
+    logging.getLogger(logger_name).disabled = True
+
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+
+# pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+# emit BEGIN itself so the rollback fixture below can nest transactions
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 @pytest.fixture(scope="session")
-def db() -> Generator:
+def _schema() -> Generator:
     Base.metadata.create_all(bind=engine)
-    yield TestingSessionLocal()
+    yield
     Base.metadata.drop_all(bind=engine)
 
-@pytest.fixture(scope="module")
-def client() -> Generator:
-    def override_get_db():
-        try:
-            db = TestingSessionLocal()
+@pytest.fixture
+def connection(_schema) -> Generator[Connection, None, None]:
+    """
+    Connection whose transaction is rolled back after each test.
+
+    `db` and the app under `client`/`aclient` all run on it, so rows seeded
+    through `db` are visible to API calls and nothing outlives the test.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+@pytest.fixture
+def db(connection) -> Generator[Session, None, None]:
+    """
+    Session on the test connection; commits only release a SAVEPOINT.
+    """
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+
+def override_get_db(connection: Connection):
+    """
+    Build a get_db override whose sessions join the test's transaction.
+
+    AsyncSession only drives its inner Session through greenlet_spawn, so
+    it can run on the synchronous test connection; the app's commits then
+    release SAVEPOINTs like the test's own.
+    """
+    def session_factory(**kw) -> Session:
+        return TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+    async def get_test_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(sync_session_class=session_factory) as db:
             yield db
-        finally:
-            db.close()
-    
-    app.dependency_overrides[get_db] = override_get_db
+    return get_test_db
+
+@pytest.fixture
+def redis() -> fakeredis.FakeRedis:
+    """
+    Synchronous view of the app's Redis, emptied before each test so rate
+    limits, sessions and cached responses never leak between tests.
+    """
+    redis = fakeredis.FakeRedis(server=redis_server)
+    redis.flushall()
+    return redis
+
+@pytest.fixture
+def client(connection, redis) -> Generator[TestClient, None, None]:
+    app.dependency_overrides[get_db] = override_get_db(connection)
     with TestClient(app) as c:
         yield c
+    app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture
+async def aclient(connection, redis) -> AsyncGenerator[AsyncClient, None]:
+    """
+    In-loop client for async tests; skips TestClient's thread portal.
+    """
+    app.dependency_overrides[get_db] = override_get_db(connection)
+    # ASGITransport does not send lifespan events, so run startup here
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+    app.dependency_overrides.clear()
@@ -0,0 +1,77 @@
+import bcrypt
+from sqlalchemy import event
+from app.core import security
+from app.models.user import User
+
+def login(client, username: str, password: str):
+    return client.post("/api/v1/auth/login", params={"username": username, "password": password})
+
+def test_login_upgrades_bcrypt_hash_to_argon2(client, db):
+    user = User(username="legacy", hashed_password=bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode())
+    db.add(user)
+    db.commit()
+
+    assert login(client, "legacy", "secret").status_code == 200
+
+    db.refresh(user)
+    assert user.hashed_password.startswith("$argon2id$")
+    client.cookies.clear()
+    assert login(client, "legacy", "secret").status_code == 200
+
+def test_failed_login_keeps_bcrypt_hash(client, db):
+    legacy_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode()
+    user = User(username="legacy", hashed_password=legacy_hash)
+    db.add(user)
+    db.commit()
+
+    assert login(client, "legacy", "wrong").status_code == 401
+
+    db.refresh(user)
+    assert user.hashed_password == legacy_hash
+
+def test_unknown_user_is_verified_against_dummy_hash(client, monkeypatch):
+    verified_hashes = []
+    verify = security._verify_password
+    def recording_verify(plain_password: str, hashed_password: str) -> bool:
+        verified_hashes.append(hashed_password)
+        return verify(plain_password, hashed_password)
+    monkeypatch.setattr(security, "_verify_password", recording_verify)
+
+    response = login(client, "nobody", "dummy-password")
+
+    assert response.status_code == 401
+    assert verified_hashes == [security._DUMMY_HASH]
+
+def register(client, username: str, email: str = None):
+    return client.post("/api/v1/auth/register", json={"username": username, "email": email, "password": "secret"})
+
+def test_register_checks_duplicates_in_one_query(client, connection):
+    statements = []
+    @event.listens_for(connection, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    assert register(client, "member", "member@example.com").status_code == 200
+
+    insert = next(i for i, statement in enumerate(statements) if statement.startswith("INSERT INTO user"))
+    assert len([statement for statement in statements[:insert] if "FROM user" in statement]) == 1
+
+def test_register_rejects_duplicate_username(client):
+    register(client, "member", "member@example.com")
+
+    response = register(client, "member", "other@example.com")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Username already registered"
+
+def test_register_rejects_duplicate_email(client):
+    register(client, "member", "member@example.com")
+
+    response = register(client, "other", "member@example.com")
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
+def test_register_allows_several_users_without_email(client):
+    assert register(client, "member").status_code == 200
+    assert register(client, "other").status_code == 200
@@ -0,0 +1,80 @@
+import pytest
+from app.models.cluster import Cluster
+from app.models.organization import Organization
+
+@pytest.fixture
+def organization(client, db) -> Organization:
+    """
+    An organization the client has joined as a logged-in member.
+    """
+    organization = Organization(name="Test Organization", invite_code="test-invite")
+    db.add(organization)
+    db.commit()
+    client.post("/api/v1/auth/register", json={"username": "member", "password": "secret"})
+    client.post("/api/v1/auth/login", params={"username": "member", "password": "secret"})
+    client.post(f"/api/v1/organizations/{organization.invite_code}/join")
+    return organization
+
+def seed_cluster(db, organization: Organization, name: str) -> Cluster:
+    """
+    Insert a cluster behind the API's back, so no cache entry is dropped.
+    """
+    cluster = Cluster(
+        name=name,
+        organization_id=organization.id,
+        cpu_limit=4, ram_limit=8, gpu_limit=0,
+        cpu_available=4, ram_available=8, gpu_available=0
+    )
+    db.add(cluster)
+    db.commit()
+    return cluster
+
+def cluster_names(client) -> list:
+    response = client.get("/api/v1/clusters/")
+    assert response.status_code == 200
+    return [cluster["name"] for cluster in response.json()]
+
+def test_cached_responses_stay_out_of_shared_caches(client, organization):
+    for path in ("/api/v1/clusters/", f"/api/v1/organizations/{organization.id}/resources"):
+        for _ in range(2):  # miss, then hit
+            response = client.get(path)
+            assert response.status_code == 200
+            assert response.headers["cache-control"] == "private, no-store"
+
+def test_cluster_listing_is_cached(client, db, organization):
+    assert cluster_names(client) == []
+
+    seed_cluster(db, organization, "unseen")
+
+    assert cluster_names(client) == []
+
+def test_create_cluster_invalidates_cached_listing(client, organization):
+    assert cluster_names(client) == []
+
+    response = client.post("/api/v1/clusters/", json={
+        "name": "fresh",
+        "organization_id": organization.id,
+        "cpu_limit": 4,
+        "ram_limit": 8,
+        "gpu_limit": 0
+    })
+
+    assert response.status_code == 200
+    assert cluster_names(client) == ["fresh"]
+
+def test_running_deployment_invalidates_cached_resources(client, db, organization):
+    cluster = seed_cluster(db, organization, "busy")
+    path = f"/api/v1/organizations/{organization.id}/resources"
+    assert client.get(path).json()["used_resources"] == {"cpu": 0, "ram": 0, "gpu": 0}
+
+    response = client.post("/api/v1/deployments/", json={
+        "name": "job",
+        "docker_image": "busybox",
+        "cluster_id": cluster.id,
+        "cpu_required": 1,
+        "ram_required": 2,
+        "gpu_required": 0
+    })
+
+    assert response.json()["status"] == "running"
+    assert client.get(path).json()["used_resources"] == {"cpu": 1, "ram": 2, "gpu": 0}
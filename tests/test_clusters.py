@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import select, text
+from app.core.config import settings
+from app.models.cluster import Cluster
+from app.models.organization import Organization
+
+@pytest.fixture
+def organization(client, db) -> Organization:
+    """
+    An organization the client has joined as a logged-in member.
+    """
+    organization = Organization(name="Test Organization", invite_code="test-invite")
+    db.add(organization)
+    db.commit()
+    client.post("/api/v1/auth/register", json={"username": "member", "password": "secret"})
+    client.post("/api/v1/auth/login", params={"username": "member", "password": "secret"})
+    client.post(f"/api/v1/organizations/{organization.invite_code}/join")
+    return organization
+
+def create_cluster(client, organization: Organization, cpu: float, ram: float, gpu: float):
+    return client.post("/api/v1/clusters/", json={
+        "name": "cluster",
+        "organization_id": organization.id,
+        "cpu_limit": cpu,
+        "ram_limit": ram,
+        "gpu_limit": gpu
+    })
+
+def allocated(db, organization: Organization) -> tuple:
+    db.refresh(organization)
+    return (organization.cpu_allocated, organization.ram_allocated, organization.gpu_allocated)
+
+def test_cluster_within_quota_is_allocated(client, db, organization):
+    organization.gpu_allocated = settings.ORG_GPU_LIMIT - 2
+    db.commit()
+
+    response = create_cluster(client, organization, cpu=4, ram=8, gpu=2)
+
+    assert response.status_code == 200
+    assert allocated(db, organization) == (4, 8, settings.ORG_GPU_LIMIT)
+
+def test_cluster_over_quota_is_rejected(client, db, organization):
+    organization.gpu_allocated = settings.ORG_GPU_LIMIT - 1
+    db.commit()
+
+    response = create_cluster(client, organization, cpu=4, ram=8, gpu=2)
+
+    assert response.status_code == 400
+    assert allocated(db, organization) == (0, 0, settings.ORG_GPU_LIMIT - 1)
+    assert db.scalars(select(Cluster)).all() == []
+
+def test_allocations_default_to_zero_in_the_database(db):
+    db.execute(text("INSERT INTO organization (name, invite_code) VALUES ('Raw', 'raw')"))
+
+    organization = db.scalars(select(Organization).where(Organization.invite_code == "raw")).one()
+
+    assert allocated(db, organization) == (0, 0, 0)
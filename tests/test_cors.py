@@ -0,0 +1,32 @@
+from app.core.config import settings
+
+def preflight(client, origin: str):
+    return client.options(
+        "/api/v1/auth/register",
+        headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type"
+        }
+    )
+
+def test_allowed_origin_may_send_credentials(client):
+    origin = settings.CORS_ORIGINS[0]
+
+    response = preflight(client, origin)
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == origin
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+def test_unknown_origin_is_refused(client):
+    response = preflight(client, "https://evil.example")
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+def test_same_origin_requests_get_no_cors_headers(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
@@ -0,0 +1,147 @@
+import pytest
+from sqlalchemy import select
+from app.models.cluster import Cluster
+from app.models.deployment import Deployment, DeploymentStatus
+from app.models.organization import Organization
+
+@pytest.fixture
+def cluster(client, db) -> Cluster:
+    """
+    A 4 CPU / 8 RAM / 2 GPU cluster in an organization the client has joined.
+    """
+    organization = Organization(name="Test Organization", invite_code="test-invite")
+    db.add(organization)
+    db.commit()
+    client.post("/api/v1/auth/register", json={"username": "member", "password": "secret"})
+    client.post("/api/v1/auth/login", params={"username": "member", "password": "secret"})
+    client.post(f"/api/v1/organizations/{organization.invite_code}/join")
+
+    cluster = Cluster(
+        name="Test Cluster",
+        organization_id=organization.id,
+        cpu_limit=4, ram_limit=8, gpu_limit=2,
+        cpu_available=4, ram_available=8, gpu_available=2
+    )
+    db.add(cluster)
+    db.commit()
+    return cluster
+
+def run(db, cluster: Cluster, name: str, priority: int, cpu: float, ram: float = 0, gpu: float = 0) -> Deployment:
+    """
+    Seed a running deployment and take its resources from the cluster.
+    """
+    deployment = Deployment(
+        name=name,
+        cluster_id=cluster.id,
+        docker_image="busybox",
+        status=DeploymentStatus.RUNNING,
+        priority=priority,
+        cpu_required=cpu,
+        ram_required=ram,
+        gpu_required=gpu
+    )
+    cluster.cpu_available -= cpu
+    cluster.ram_available -= ram
+    cluster.gpu_available -= gpu
+    db.add(deployment)
+    db.commit()
+    return deployment
+
+def deploy(client, cluster: Cluster, priority: int, cpu: float, ram: float = 0, gpu: float = 0) -> dict:
+    response = client.post("/api/v1/deployments/", json={
+        "name": "new",
+        "docker_image": "busybox",
+        "cluster_id": cluster.id,
+        "priority": priority,
+        "cpu_required": cpu,
+        "ram_required": ram,
+        "gpu_required": gpu
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def statuses(db) -> dict:
+    return {name: status for name, status in db.execute(select(Deployment.name, Deployment.status))}
+
+def available(db, cluster: Cluster) -> tuple:
+    db.refresh(cluster)
+    return cluster.cpu_available, cluster.ram_available, cluster.gpu_available
+
+def test_deployment_that_fits_reserves_resources(client, db, cluster):
+    deployment = deploy(client, cluster, priority=1, cpu=1, ram=2, gpu=1)
+
+    assert deployment["status"] == "running"
+    assert available(db, cluster) == (3, 6, 1)
+
+def test_deployment_larger_than_cluster_is_rejected(client, db, cluster):
+    response = client.post("/api/v1/deployments/", json={
+        "name": "huge",
+        "docker_image": "busybox",
+        "cluster_id": cluster.id,
+        "cpu_required": 5,
+        "ram_required": 0,
+        "gpu_required": 0
+    })
+
+    assert response.status_code == 400
+    assert available(db, cluster) == (4, 8, 2)
+
+def test_preemption_takes_shortest_covering_prefix(client, db, cluster):
+    run(db, cluster, "low-old", priority=1, cpu=1)
+    run(db, cluster, "low-new", priority=1, cpu=1)
+    run(db, cluster, "mid", priority=2, cpu=2)
+
+    deployment = deploy(client, cluster, priority=5, cpu=2)
+
+    assert deployment["status"] == "running"
+    assert statuses(db) == {
+        "low-old": DeploymentStatus.PREEMPTED,
+        "low-new": DeploymentStatus.PREEMPTED,
+        "mid": DeploymentStatus.RUNNING,
+        "new": DeploymentStatus.RUNNING
+    }
+    assert available(db, cluster) == (0, 8, 2)
+
+def test_preemption_prefers_newest_within_a_priority(client, db, cluster):
+    run(db, cluster, "low-old", priority=1, cpu=2)
+    run(db, cluster, "low-new", priority=1, cpu=2)
+
+    deploy(client, cluster, priority=5, cpu=2)
+
+    assert statuses(db) == {
+        "low-old": DeploymentStatus.RUNNING,
+        "low-new": DeploymentStatus.PREEMPTED,
+        "new": DeploymentStatus.RUNNING
+    }
+
+def test_uncoverable_shortfall_stays_pending(client, db, cluster):
+    run(db, cluster, "low", priority=1, cpu=1)
+    run(db, cluster, "high", priority=9, cpu=3)
+
+    deployment = deploy(client, cluster, priority=5, cpu=3)
+
+    assert deployment["status"] == "pending"
+    assert statuses(db) == {
+        "low": DeploymentStatus.RUNNING,
+        "high": DeploymentStatus.RUNNING,
+        "new": DeploymentStatus.PENDING
+    }
+    assert available(db, cluster) == (0, 8, 2)
+
+def test_preemption_covers_every_resource_shortfall(client, db, cluster):
+    # The newest low-priority job frees enough GPU on its own, but CPU and
+    # RAM need the next one too
+    run(db, cluster, "low-old", priority=1, cpu=2, ram=1)
+    run(db, cluster, "low-new", priority=1, cpu=1, ram=1, gpu=2)
+    run(db, cluster, "mid", priority=3, cpu=1, ram=6)
+
+    deployment = deploy(client, cluster, priority=5, cpu=2, ram=2, gpu=1)
+
+    assert deployment["status"] == "running"
+    assert statuses(db) == {
+        "low-old": DeploymentStatus.PREEMPTED,
+        "low-new": DeploymentStatus.PREEMPTED,
+        "mid": DeploymentStatus.RUNNING,
+        "new": DeploymentStatus.RUNNING
+    }
+    assert available(db, cluster) == (1, 0, 1)
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import select
+from app.api.v1.endpoints import organizations
+from app.models.organization import Organization
+
+@pytest.fixture
+def member(client, db) -> None:
+    """
+    A logged-in user with no organization, and an organization holding code "taken".
+    """
+    db.add(Organization(name="Existing", invite_code="taken"))
+    db.commit()
+    client.post("/api/v1/auth/register", json={"username": "member", "password": "secret"})
+    client.post("/api/v1/auth/login", params={"username": "member", "password": "secret"})
+
+def generate_codes(monkeypatch, *codes: str) -> None:
+    monkeypatch.setattr(organizations, "generate_invite_code", iter(codes).__next__)
+
+def test_colliding_invite_code_is_retried(client, db, monkeypatch, member):
+    generate_codes(monkeypatch, "taken", "fresh")
+
+    response = client.post("/api/v1/organizations/", json={"name": "New"})
+
+    assert response.status_code == 200
+    assert response.json()["invite_code"] == "fresh"
+    assert client.get(f"/api/v1/organizations/{response.json()['id']}/resources").status_code == 200
+
+def test_invite_code_collisions_give_up(client, db, monkeypatch, member):
+    generate_codes(monkeypatch, *["taken"] * organizations.INVITE_CODE_ATTEMPTS)
+
+    response = client.post("/api/v1/organizations/", json={"name": "New"})
+
+    assert response.status_code == 500
+    assert db.scalars(select(Organization.name)).all() == ["Existing"]
@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.core import rate_limit
+from app.core.config import settings
+
+LOGIN_PATH = f"{settings.API_V1_STR}/auth/login"
+DEPLOYMENTS_PATH = f"{settings.API_V1_STR}/deployments/"
+
+# Bursts go to the deployments listing: without a session it answers 401
+# before opening a transaction, so concurrent requests can share the test
+# connection (interleaved login queries would tangle its savepoints)
+async def burst(aclient, method: str, path: str, **kwargs) -> list:
+    return await asyncio.gather(*(
+        aclient.request(method, path, **kwargs)
+        for _ in range(settings.DEPLOYMENTS_RATE_LIMIT_PER_MINUTE + 1)
+    ))
+
+def test_login_is_rate_limited(client):
+    for _ in range(settings.LOGIN_RATE_LIMIT_PER_MINUTE):
+        response = client.post("/api/v1/auth/login", params={"username": "nobody", "password": "wrong"})
+        assert response.status_code == 401
+
+    response = client.post("/api/v1/auth/login", params={"username": "nobody", "password": "wrong"})
+
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Too many requests"}
+    assert 0 < int(response.headers["retry-after"]) <= 60
+
+@pytest.mark.asyncio
+async def test_concurrent_burst_is_rate_limited(aclient):
+    responses = await burst(aclient, "GET", DEPLOYMENTS_PATH)
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [401] * settings.DEPLOYMENTS_RATE_LIMIT_PER_MINUTE + [429]
+
+@pytest.mark.asyncio
+async def test_unlimited_paths_pass_through(aclient):
+    responses = await burst(aclient, "GET", f"{settings.API_V1_STR}/clusters/")
+
+    assert all(response.status_code == 401 for response in responses)
+
+def test_previous_minute_counts_by_remaining_overlap(client, redis, monkeypatch):
+    # Halfway through a minute whose predecessor used the whole limit, half
+    # of that earlier traffic still falls inside the trailing 60 seconds
+    window = 1_000_000
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: window * 60 + 30))
+    redis.set(f"rl:{LOGIN_PATH}:testclient:{window - 1}", settings.LOGIN_RATE_LIMIT_PER_MINUTE)
+
+    allowed = settings.LOGIN_RATE_LIMIT_PER_MINUTE // 2
+    for _ in range(allowed):
+        response = client.post(LOGIN_PATH, params={"username": "nobody", "password": "wrong"})
+        assert response.status_code == 401
+
+    response = client.post(LOGIN_PATH, params={"username": "nobody", "password": "wrong"})
+
+    assert response.status_code == 429
+
+@pytest.mark.asyncio
+async def test_preflight_is_not_counted_and_rejections_carry_cors_headers(aclient):
+    origin = settings.CORS_ORIGINS[0]
+    preflights = await burst(
+        aclient, "OPTIONS", DEPLOYMENTS_PATH,
+        headers={"Origin": origin, "Access-Control-Request-Method": "GET"}
+    )
+    assert all(response.status_code == 200 for response in preflights)
+
+    responses = await burst(aclient, "GET", DEPLOYMENTS_PATH, headers={"Origin": origin})
+
+    rejected = [response for response in responses if response.status_code == 429]
+    assert len(rejected) == 1
+    response = rejected[0]
+    assert response.headers["access-control-allow-origin"] == origin
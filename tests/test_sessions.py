@@ -0,0 +1,66 @@
+from app.core.config import settings
+from app.core.sessions import RedisSessionMiddleware
+
+COOKIE = settings.SESSION_COOKIE_NAME
+
+def login(client, username: str = "member") -> str:
+    """
+    Register and log in; return the issued session cookie.
+    """
+    client.post("/api/v1/auth/register", json={"username": username, "password": "secret"})
+    response = client.post("/api/v1/auth/login", params={"username": username, "password": "secret"})
+    assert response.status_code == 200
+    return response.cookies[COOKIE]
+
+def get_deployments(client, cookie: str):
+    client.cookies.clear()
+    client.cookies.set(COOKIE, cookie)
+    return client.get("/api/v1/deployments/")
+
+def test_login_authenticates_the_session(client):
+    cookie = login(client)
+
+    assert get_deployments(client, cookie).status_code == 200
+
+def test_logout_revokes_the_session(client, redis):
+    cookie = login(client)
+    session_id = cookie.rpartition(".")[0]
+
+    assert client.post("/api/v1/auth/logout").status_code == 200
+    assert not redis.exists(f"sess:{session_id}")
+    assert get_deployments(client, cookie).status_code == 401
+
+def test_login_rotates_a_planted_session_id(client, redis):
+    # An attacker's pre-login session id must not become authenticated
+    client.post("/api/v1/auth/register", json={"username": "victim", "password": "secret"})
+    planted = RedisSessionMiddleware(None, redis, settings.SECRET_KEY)
+    planted_id = "planted-session-id"
+    redis.set(f"sess:{planted_id}", '{"visited": true}')
+    planted_cookie = f"{planted_id}.{planted._sign(planted_id)}"
+
+    client.cookies.set(COOKIE, planted_cookie)
+    response = client.post("/api/v1/auth/login", params={"username": "victim", "password": "secret"})
+
+    assert response.cookies[COOKIE] != planted_cookie
+    assert not redis.exists(f"sess:{planted_id}")
+    assert get_deployments(client, planted_cookie).status_code == 401
+
+def test_forged_cookie_is_rejected(client):
+    session_id, _, signature = login(client).rpartition(".")
+
+    assert get_deployments(client, f"{session_id}.{'0' * len(signature)}").status_code == 401
+    assert get_deployments(client, session_id).status_code == 401
+
+def test_non_ascii_cookie_is_rejected(client):
+    response = client.get(
+        "/api/v1/deployments/",
+        headers={"cookie": f"{COOKIE}=abc.\u00e9\u00e9".encode("latin-1")}
+    )
+
+    assert response.status_code == 401
+
+def test_long_secret_keys_sign_cookies():
+    middleware = RedisSessionMiddleware(None, None, "k" * 128)
+
+    assert middleware._unsign(f"abc.{middleware._sign('abc')}") == "abc"
+    assert middleware._unsign("abc.00") is None
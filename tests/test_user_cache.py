@@ -0,0 +1,49 @@
+import pytest
+from app.core.config import settings
+from app.models.organization import Organization
+
+@pytest.fixture
+def user_id(client) -> int:
+    """
+    Register and log in a member with no organization.
+    """
+    response = client.post("/api/v1/auth/register", json={"username": "member", "password": "secret"})
+    client.post("/api/v1/auth/login", params={"username": "member", "password": "secret"})
+    return response.json()["id"]
+
+def cache_snapshot(client) -> None:
+    """
+    Make an authenticated request so the user snapshot lands in Redis.
+    """
+    assert client.get("/api/v1/clusters/").status_code == 200
+
+def test_snapshot_is_cached_with_ttl(client, redis, user_id):
+    cache_snapshot(client)
+
+    assert 0 < redis.ttl(f"user:{user_id}") <= settings.USER_CACHE_TTL
+
+def test_join_invalidates_snapshot(client, db, redis, user_id):
+    organization = Organization(name="Test Organization", invite_code="test-invite")
+    db.add(organization)
+    db.commit()
+    cache_snapshot(client)
+
+    client.post(f"/api/v1/organizations/{organization.invite_code}/join")
+
+    assert not redis.exists(f"user:{user_id}")
+    assert client.get(f"/api/v1/organizations/{organization.id}/resources").status_code == 200
+
+def test_create_invalidates_snapshot(client, redis, user_id):
+    cache_snapshot(client)
+
+    organization = client.post("/api/v1/organizations/", json={"name": "Fresh"}).json()
+
+    assert not redis.exists(f"user:{user_id}")
+    assert client.get(f"/api/v1/organizations/{organization['id']}/resources").status_code == 200
+
+def test_logout_invalidates_snapshot(client, redis, user_id):
+    cache_snapshot(client)
+
+    client.post("/api/v1/auth/logout")
+
+    assert not redis.exists(f"user:{user_id}")